@@ -11,13 +11,22 @@ Features:
 - Configurable via environment variables
 """
 
+import functools
 import json
 import os
 import re
 import sys
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser is the fallback
+    json_loads = json.loads
 
-# Safe commands to auto-approve (patterns)
+
+# Safe commands to auto-approve (patterns).
+# Each pattern is anchored on a literal first word (^word) and is only
+# tried against commands that start with that word.
 SAFE_PATTERNS = [
     # Validation commands
     r'^cd\s+(frontend|backend|electron|mobile|chrome-extension)\s*&&\s*npm\s+(run\s+)?(build|lint|test)',
@@ -42,35 +51,109 @@ SAFE_PATTERNS = [
     r'^npm\s+--version',
 ]
 
-# Dangerous commands to block
+# Dangerous commands to block, each with a literal it needs somewhere in
+# the command. Patterns are only tried when their literal is present.
 DANGEROUS_PATTERNS = [
-    r'rm\s+(-[rf]+\s+|.*-[rf])',  # rm -rf, rm -r, rm -f
-    r'sudo\s+',                    # Any sudo
-    r'chmod\s+777',                # World writable
-    r'>\s*/dev/',                  # Writing to /dev
-    r'\|\s*(ba)?sh',               # Piping to shell
-    r'curl.*\|\s*(ba)?sh',         # Curl pipe to shell
-    r'wget.*\|\s*(ba)?sh',         # Wget pipe to shell
-    r'eval\s+',                    # Eval
-    r':\s*\(\)\s*\{',              # Fork bomb pattern
-    r'mkfs\.',                     # Filesystem format
-    r'dd\s+if=',                   # dd command
+    (r'rm\s+(-[rf]+\s+|.*-[rf])', 'rm'),  # rm -rf, rm -r, rm -f
+    (r'sudo\s+', 'sudo'),                 # Any sudo
+    (r'chmod\s+777', 'chmod'),            # World writable
+    (r'>\s*/dev/', '/dev/'),              # Writing to /dev
+    (r'\|\s*(ba)?sh', '|'),               # Piping to shell
+    (r'curl.*\|\s*(ba)?sh', '|'),         # Curl pipe to shell
+    (r'wget.*\|\s*(ba)?sh', '|'),         # Wget pipe to shell
+    (r'eval\s+', 'eval'),                 # Eval
+    (r':\s*\(\)\s*\{', '('),              # Fork bomb pattern
+    (r'mkfs\.', 'mkfs.'),                 # Filesystem format
+    (r'dd\s+if=', 'dd'),                  # dd command
 ]
 
-# Commands to always ask about (neither auto-approve nor block)
-ASK_PATTERNS = [
-    r'git\s+(push|pull|checkout|merge|rebase|reset)',  # Git write operations
-    r'npm\s+(install|uninstall|update)',               # Package modifications
-    r'rm\s+',                                           # Any rm without -rf
-    r'mv\s+',                                           # Move commands
-    r'cp\s+',                                           # Copy commands
-]
+# Commands to always ask about (neither auto-approve nor block).
+# Matched against every word of the command, so `ls && mv a b` still asks.
+# Like an unanchored regex, a word only has to end with the command name
+# (`scp`, `/bin/rm`) and the next word start with the subcommand.
+ASK_COMMANDS = (
+    'rm',  # Any rm without -rf
+    'mv',  # Move commands
+    'cp',  # Copy commands
+)
+ASK_SUBCOMMANDS = {
+    'git': ('push', 'pull', 'checkout', 'merge', 'rebase', 'reset'),  # Git write operations
+    'npm': ('install', 'uninstall', 'update'),                         # Package modifications
+}
+_ASK_PARENTS = tuple(ASK_SUBCOMMANDS)
+
+# Shell operators split words the same way whitespace does; a backslash
+# (as in `\mv`, which bypasses aliases) does not hide the command name
+_WORD_SEPARATORS = str.maketrans({c: ' ' for c in ';&|()<>`$"\'\\'})
+
+
+def _fuse(patterns: list[str], prefix: str) -> re.Pattern:
+    """Join patterns into one alternation with a named group per pattern."""
+    alternatives = (f'(?P<{prefix}{i}>{p})' for i, p in enumerate(patterns))
+    return re.compile('|'.join(alternatives), re.IGNORECASE)
+
+
+# Distinct DANGEROUS literals, in pattern order
+_DANGEROUS_LITERALS = tuple(dict.fromkeys(literal for _, literal in DANGEROUS_PATTERNS))
+
+
+# Compiled on first use, and only for the literals/first words a command
+# actually contains; match.lastgroup maps a hit back to its source pattern.
+@functools.cache
+def _safe_re(head: str) -> re.Pattern | None:
+    prefix = '^' + head
+    patterns = [
+        p for p in SAFE_PATTERNS
+        if p.startswith(prefix) and not p[len(prefix):len(prefix) + 1].isalnum()
+    ]
+    return _fuse(patterns, 's') if patterns else None
+
+
+@functools.cache
+def _dangerous_re(literal: str) -> tuple[re.Pattern, list[str]]:
+    patterns = [pattern for pattern, needed in DANGEROUS_PATTERNS if needed == literal]
+    return _fuse(patterns, 'd'), patterns
+
+
+def find_dangerous(command_normalized: str, command_folded: str) -> str | None:
+    """
+    Return a DANGEROUS pattern the command matches, if any.
+    Literal groups are tried in pattern order; within a group the match
+    that starts leftmost in the command is reported, so `curl x | sh`
+    reports the curl pattern rather than the plain pipe-to-shell one.
+    """
+    for literal in _DANGEROUS_LITERALS:
+        if literal in command_folded:
+            pattern_re, patterns = _dangerous_re(literal)
+            match = pattern_re.search(command_normalized)
+            if match:
+                return patterns[int(match.lastgroup[1:])]
+    return None
+
+
+def should_ask(command_folded: str) -> bool:
+    """Check whether any word of the command is a write operation to ask about."""
+    words = command_folded.translate(_WORD_SEPARATORS).split()
+    for word, next_word in zip(words, words[1:] + ['']):
+        if word.endswith(ASK_COMMANDS):
+            return True
+        if word.endswith(_ASK_PARENTS):
+            for parent, subcommands in ASK_SUBCOMMANDS.items():
+                if word.endswith(parent) and next_word.startswith(subcommands):
+                    return True
+    return False
+
+
+def write_stderr(message: str) -> None:
+    """Write a line to stderr as UTF-8 bytes, bypassing the text wrapper."""
+    sys.stderr.buffer.write(f"{message}\n".encode('utf-8'))
+    sys.stderr.buffer.flush()
 
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        input_data = json_loads(sys.stdin.buffer.read())
+    except ValueError:
         sys.exit(0)
 
     # Only process Bash tool
@@ -82,36 +165,39 @@ def main():
         sys.exit(0)
 
     command = input_data.get("tool_input", {}).get("command", "")
-    if not command:
-        sys.exit(0)
 
     # Normalize command for matching
     command_normalized = command.strip()
+    if not command_normalized:
+        sys.exit(0)
+
+    # casefold() mirrors re.IGNORECASE for the literal dispatch
+    command_folded = command_normalized.casefold()
+    head = command_folded.split(None, 1)[0]
 
     # Check dangerous patterns first
-    for pattern in DANGEROUS_PATTERNS:
-        if re.search(pattern, command_normalized, re.IGNORECASE):
-            print(f"🚫 Blocked dangerous command pattern: {pattern}", file=sys.stderr)
-            sys.exit(2)  # Exit 2 = blocking error, shown to Claude
+    pattern = find_dangerous(command_normalized, command_folded)
+    if pattern:
+        write_stderr(f"🚫 Blocked dangerous command pattern: {pattern}")
+        sys.exit(2)  # Exit 2 = blocking error, shown to Claude
 
     # Check if we should ask (neither approve nor block)
-    for pattern in ASK_PATTERNS:
-        if re.search(pattern, command_normalized, re.IGNORECASE):
-            # Don't interfere - let normal permission flow happen
-            sys.exit(0)
+    if should_ask(command_folded):
+        # Don't interfere - let normal permission flow happen
+        sys.exit(0)
 
     # Check safe patterns for auto-approval
-    for pattern in SAFE_PATTERNS:
-        if re.search(pattern, command_normalized, re.IGNORECASE):
-            output = {
-                "hookSpecificOutput": {
-                    "hookEventName": "PreToolUse",
-                    "permissionDecision": "allow",
-                    "permissionDecisionReason": "Auto-approved by RALPH (safe validation command)"
-                }
+    safe_re = _safe_re(head)
+    if safe_re and safe_re.search(command_normalized):
+        output = {
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "allow",
+                "permissionDecisionReason": "Auto-approved by RALPH (safe validation command)"
             }
-            print(json.dumps(output))
-            sys.exit(0)
+        }
+        print(json.dumps(output))
+        sys.exit(0)
 
     # Default: don't interfere
     sys.exit(0)
@@ -0,0 +1,172 @@
+#!/usr/bin/env node
+/**
+ * RALPH oxlint daemon - Long-lived lint server for post-edit-lint.py
+ *
+ * Linting one file with oxlint takes milliseconds; starting it through
+ * `npx` on every edit is what makes the lint hook slow. The hook sends lint
+ * requests here over a Unix socket instead. The oxlint binary is resolved
+ * once per package and spawned directly for each request.
+ *
+ * Protocol: the client writes one JSON line `{"cwd": ..., "args": [...]}`
+ * and reads until the connection closes: `ok\n` followed by oxlint's raw
+ * stdout + stderr, or a single `error: <message>\n` line.
+ *
+ * Usage: node oxlint-daemon.mjs <socket-path>
+ * Exits after IDLE_TIMEOUT_MS without requests.
+ */
+
+import { execFile } from 'child_process';
+import { existsSync, unlinkSync } from 'fs';
+import { createRequire } from 'module';
+import { createConnection, createServer } from 'net';
+import { isAbsolute, join } from 'path';
+
+const LINT_TIMEOUT_MS = 10_000;
+const IDLE_TIMEOUT_MS = 10 * 60 * 1000;
+
+// Native binaries from oxlint's optional platform packages
+const NATIVE_BINARIES = {
+  darwin: {
+    arm64: ['@oxlint/darwin-arm64/oxlint'],
+    x64: ['@oxlint/darwin-x64/oxlint'],
+  },
+  linux: {
+    arm64: ['@oxlint/linux-arm64-gnu/oxlint', '@oxlint/linux-arm64-musl/oxlint'],
+    x64: ['@oxlint/linux-x64-gnu/oxlint', '@oxlint/linux-x64-musl/oxlint'],
+  },
+};
+
+const socketPath = process.argv[2];
+const commands = new Map();
+let idleTimer;
+
+/**
+ * Resolve how to run oxlint for a package: the native binary if it is
+ * installed, else the package's .bin shim, else npx. The npx fallback is
+ * not cached, so installing node_modules later is picked up.
+ */
+function resolveOxlint(cwd) {
+  const cached = commands.get(cwd);
+  if (cached) {
+    return cached;
+  }
+
+  let command;
+  const require = createRequire(join(cwd, 'package.json'));
+  for (const candidate of NATIVE_BINARIES[process.platform]?.[process.arch] ?? []) {
+    try {
+      command = { file: require.resolve(candidate), args: [] };
+      break;
+    } catch {
+      // Platform package not installed
+    }
+  }
+
+  if (!command) {
+    const shim = join(cwd, 'node_modules', '.bin', 'oxlint');
+    if (!existsSync(shim)) {
+      return { file: 'npx', args: ['oxlint'] };
+    }
+    command = { file: shim, args: [] };
+  }
+
+  commands.set(cwd, command);
+  return command;
+}
+
+function isValidRequest(request) {
+  return (
+    typeof request?.cwd === 'string' &&
+    isAbsolute(request.cwd) &&
+    Array.isArray(request.args) &&
+    request.args.every((arg) => typeof arg === 'string')
+  );
+}
+
+function replyError(socket, message) {
+  socket.end(`error: ${message}\n`);
+}
+
+function handleRequest(socket, line) {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    replyError(socket, `Invalid request: ${error.message}`);
+    return;
+  }
+  if (!isValidRequest(request)) {
+    replyError(socket, 'Invalid request: expected an absolute cwd and string args');
+    return;
+  }
+
+  const { file, args } = resolveOxlint(request.cwd);
+  execFile(
+    file,
+    [...args, ...request.args],
+    { cwd: request.cwd, encoding: 'buffer', timeout: LINT_TIMEOUT_MS, maxBuffer: 16 * 1024 * 1024 },
+    (error, stdout, stderr) => {
+      // oxlint exits non-zero when it reports problems; only a failed
+      // launch or a timeout (no numeric exit code) is an error here
+      if (error && typeof error.code !== 'number') {
+        replyError(socket, error.message);
+        return;
+      }
+      socket.end(Buffer.concat([Buffer.from('ok\n'), stdout, stderr]));
+    }
+  );
+}
+
+function shutdown() {
+  server.close();
+  try {
+    unlinkSync(socketPath);
+  } catch {
+    // Already removed
+  }
+  process.exit(0);
+}
+
+function resetIdleTimer() {
+  clearTimeout(idleTimer);
+  idleTimer = setTimeout(shutdown, IDLE_TIMEOUT_MS);
+}
+
+const server = createServer((socket) => {
+  resetIdleTimer();
+  let buffer = '';
+  socket.setEncoding('utf8');
+  socket.on('error', () => socket.destroy());
+  socket.on('data', (chunk) => {
+    buffer += chunk;
+    const newline = buffer.indexOf('\n');
+    if (newline !== -1) {
+      socket.removeAllListeners('data');
+      handleRequest(socket, buffer.slice(0, newline));
+    }
+  });
+});
+
+server.on('error', () => process.exit(1));
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);
+
+if (!socketPath) {
+  console.error('Usage: node oxlint-daemon.mjs <socket-path>');
+  process.exit(1);
+}
+
+// Another hook may have started a daemon first; only take over a dead socket
+const probe = createConnection(socketPath);
+probe.on('connect', () => {
+  probe.destroy();
+  process.exit(0);
+});
+probe.on('error', () => {
+  try {
+    unlinkSync(socketPath);
+  } catch {
+    // No stale socket
+  }
+  server.listen(socketPath, resetIdleTimer);
+});
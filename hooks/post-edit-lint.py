@@ -7,94 +7,283 @@ Claude sees errors right away, enabling faster iteration.
 
 Features:
 - Only runs on TypeScript/JavaScript files
-- Uses oxlint for speed
+- Uses oxlint for speed, through a long-lived daemon when available
 - Provides context back to Claude
 - Non-blocking (informational only)
+- Caches results per file, so unchanged files are not re-linted
 """
 
+import contextlib
+import functools
 import json
 import os
-import subprocess
+import re
 import sys
-from pathlib import Path
+import time
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser is the fallback
+    json_loads = json.loads
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, concurrent runs just lint twice
+    fcntl = None
 
 
 # File extensions to lint
 LINTABLE_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'}
 
-# Package detection patterns
-PACKAGE_PATTERNS = [
-    ('frontend/', 'frontend'),
-    ('backend/', 'backend'),
-    ('electron/', 'electron'),
-    ('mobile/', 'mobile'),
-    ('chrome-extension/', 'chrome-extension'),
-]
-
-
-def get_package_for_file(file_path: str) -> str | None:
-    """Determine which package a file belongs to."""
-    for pattern, package in PACKAGE_PATTERNS:
-        if pattern in file_path:
-            return package
+# Package detection: top-level project directory -> package
+PACKAGE_DIRS = {
+    'frontend': 'frontend',
+    'backend': 'backend',
+    'electron': 'electron',
+    'mobile': 'mobile',
+    'chrome-extension': 'chrome-extension',
+}
+
+# Max files remembered in the lint cache (oldest entries are dropped first)
+LINT_CACHE_MAX_ENTRIES = 500
+
+LINT_TIMEOUT = 10  # seconds
+
+# Max seconds to wait for another hook linting the same file, and for the
+# cache lock; with LINT_TIMEOUT this stays inside the 15 s hook timeout
+LINT_LOCK_WAIT = 3
+CACHE_LOCK_WAIT = 1
+
+# Max lint output lines passed back to Claude
+MAX_OUTPUT_LINES = 15
+
+# Daemon that keeps oxlint resolved between edits (see oxlint-daemon.mjs)
+LINT_DAEMON_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'oxlint-daemon.mjs')
+
+# Unix socket path limit (sun_path: 108 bytes on Linux, 104 on macOS)
+MAX_SOCKET_PATH = 104
+
+
+# Compiled on first use, so edits that exit early never build them
+@functools.cache
+def _issue_re() -> re.Pattern:
+    # Output worth reporting mentions a warning or an error
+    return re.compile(rb'warning|error', re.IGNORECASE)
+
+
+@functools.cache
+def _noise_line_re() -> re.Pattern:
+    # Blank lines and oxlint metadata, removed from the feedback
+    return re.compile(r'^(?:[^\S\n]*|Finished in.*|.*Found 0 warnings.*)$\n?', re.MULTILINE)
+
+
+def get_package_for_file(relative_path: str) -> str | None:
+    """Determine which package a file belongs to from its project-relative path."""
+    top = relative_path.split(os.sep, 1)[0]
+    return PACKAGE_DIRS.get(top)
+
+
+def get_lint_cache_file(project_root: str) -> str:
+    """Get path to the lint result cache."""
+    return os.path.join(project_root, '.ralph', 'lint-cache.json')
+
+
+def load_lint_cache(cache_file: str) -> dict:
+    """Load cached lint results, keyed by file path."""
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_lint_cache(cache_file: str, cache: dict) -> None:
+    """Save lint results, keeping only the most recently used files."""
+    entries = dict(list(cache.items())[-LINT_CACHE_MAX_ENTRIES:])
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(entries, f)
+    os.replace(tmp_file, cache_file)
+
+
+def update_lint_cache(cache_file: str, file_path: str, entry: dict) -> None:
+    """Record a file's lint result as the most recently used one."""
+    # Re-load under the lock so entries saved by concurrent hooks are kept
+    with locked(f"{os.path.splitext(cache_file)[0]}.lock", CACHE_LOCK_WAIT):
+        cache = load_lint_cache(cache_file)
+        # Re-inserting moves the file to the most recent end of the cache
+        cache.pop(file_path, None)
+        cache[file_path] = entry
+        save_lint_cache(cache_file, cache)
+
+
+def get_lint_lock_file(project_root: str, file_path: str) -> str:
+    """Get path to the lock held while a file is being linted."""
+    import hashlib
+
+    name = hashlib.sha1(file_path.encode()).hexdigest()[:16]
+    return os.path.join(project_root, '.ralph', 'lint-locks', f"{name}.lock")
+
+
+@contextlib.contextmanager
+def locked(lock_file: str, wait: float):
+    """
+    Hold an exclusive advisory lock on lock_file.
+    Gives up after wait seconds and continues unlocked, so a stuck hook
+    cannot push this one past its timeout.
+    """
+    os.makedirs(os.path.dirname(lock_file), exist_ok=True)
+    with open(lock_file, 'a') as f:
+        if fcntl is not None:
+            deadline = time.monotonic() + wait
+            while True:
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        break
+                    time.sleep(0.05)
+        yield
+
+
+def get_lint_daemon_socket(project_root: str) -> str:
+    """
+    Get path to the oxlint daemon's Unix socket. It is kept in the temp
+    directory, named after the project, because socket paths are limited to
+    about 100 bytes and project paths can be longer.
+    """
+    import hashlib
+    import tempfile
+
+    name = hashlib.sha1(os.path.abspath(project_root).encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"ralph-oxlint-{name}.sock")
+
+
+def start_lint_daemon(socket_path: str) -> None:
+    """Start the oxlint daemon in the background for later edits."""
+    import subprocess
+
+    subprocess.Popen(
+        ['node', LINT_DAEMON_SCRIPT, socket_path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def lint_with_daemon(package_dir: str, args: list[str], project_root: str, timeout: float) -> bytes | None:
+    """Lint through the oxlint daemon. Returns None if it can't, so the caller falls back to npx."""
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(LINT_DAEMON_SCRIPT):
+        return None
+
+    socket_path = get_lint_daemon_socket(project_root)
+    if len(os.fsencode(socket_path)) >= MAX_SOCKET_PATH:
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            try:
+                sock.connect(socket_path)
+            except OSError:
+                # Not running yet: start it for the next edit, lint this one directly
+                start_lint_daemon(socket_path)
+                return None
+
+            sock.sendall(json.dumps({"cwd": package_dir, "args": args}).encode() + b'\n')
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        # Timed out, connection dropped, or node is not installed
+        return None
+
+    # An "error: ..." reply means the daemon could not run oxlint
+    status, _, output = b''.join(chunks).partition(b'\n')
+    return output if status == b'ok' else None
+
+
+def lint_with_npx(package_dir: str, args: list[str], timeout: float = LINT_TIMEOUT) -> bytes:
+    """Lint by running oxlint through npx, with stderr merged into stdout."""
+    import subprocess  # Deferred: only needed once a lintable file is confirmed
+
+    result = subprocess.run(
+        ['npx', 'oxlint', *args],
+        cwd=package_dir,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        timeout=timeout
+    )
+    return result.stdout
+
+
+def lint_file(file_path: str, package_dir: str, oxlint_config: str, project_root: str) -> str | None:
+    """Run oxlint on a single file and return output if issues found."""
+    args = []
+    if os.path.exists(oxlint_config):
+        args.extend(['--config', '.oxlintrc.json'])
+    args.append(file_path)
+
+    # The daemon and the npx fallback share one LINT_TIMEOUT budget
+    deadline = time.monotonic() + LINT_TIMEOUT
+    raw_output = lint_with_daemon(package_dir, args, project_root, LINT_TIMEOUT)
+    if raw_output is None:
+        raw_output = lint_with_npx(package_dir, args, max(deadline - time.monotonic(), 0))
+
+    # Check if there are actual issues (not just "Finished in Xms")
+    if _issue_re().search(raw_output):
+        output = raw_output.decode('utf-8', 'replace').strip()
+        # Filter to relevant lines, splitting no further than the limit
+        relevant = _noise_line_re().sub('', output).rstrip('\n')
+        if relevant:
+            return '\n'.join(relevant.split('\n', MAX_OUTPUT_LINES)[:MAX_OUTPUT_LINES])
+
     return None
 
 
 def run_lint(file_path: str, package: str, project_root: str) -> str | None:
-    """Run oxlint on a single file and return output if issues found."""
+    """Lint a file, reusing the cached result if neither it nor the config changed."""
     package_dir = os.path.join(project_root, package)
 
     # Check if oxlint config exists
     oxlint_config = os.path.join(package_dir, '.oxlintrc.json')
 
-    try:
-        cmd = ['npx', 'oxlint']
-        if os.path.exists(oxlint_config):
-            cmd.extend(['--config', '.oxlintrc.json'])
-        cmd.append(file_path)
-
-        result = subprocess.run(
-            cmd,
-            cwd=package_dir,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-
-        output = (result.stdout + result.stderr).strip()
-
-        # Check if there are actual issues (not just "Finished in Xms")
-        if output and ('warning' in output.lower() or 'error' in output.lower()):
-            # Filter to relevant lines
-            lines = output.split('\n')
-            relevant = []
-            for line in lines:
-                # Skip empty lines and metadata
-                if not line.strip():
-                    continue
-                if line.startswith('Finished in'):
-                    continue
-                if 'Found 0 warnings' in line:
-                    continue
-                relevant.append(line)
-
-            if relevant:
-                return '\n'.join(relevant[:15])  # Limit output
-
-        return None
+    cache_file = get_lint_cache_file(project_root)
 
-    except subprocess.TimeoutExpired:
-        return None
-    except FileNotFoundError:
-        return None
-    except Exception as e:
+    try:
+        stat = os.stat(file_path)
+        try:
+            config_mtime = os.stat(oxlint_config).st_mtime_ns
+        except OSError:
+            config_mtime = None
+        signature = [stat.st_mtime_ns, stat.st_size, config_mtime]
+
+        # A hook already linting this file leaves its result in the cache
+        with locked(get_lint_lock_file(project_root, file_path), LINT_LOCK_WAIT):
+            entry = load_lint_cache(cache_file).get(file_path)
+            if entry and entry.get("signature") == signature:
+                output = entry.get("output")
+            else:
+                output = lint_file(file_path, package_dir, oxlint_config, project_root)
+            update_lint_cache(cache_file, file_path, {"signature": signature, "output": output})
+            return output
+
+    except Exception:
+        # Timeouts, missing npx, daemon errors, unreadable files: no feedback, nothing cached
         return None
 
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        input_data = json_loads(sys.stdin.buffer.read())
+    except ValueError:
         sys.exit(0)
 
     # Only process Edit and Write tools
@@ -114,27 +303,28 @@ def main():
         sys.exit(0)
 
     # Check if it's a lintable file
-    ext = Path(file_path).suffix.lower()
+    ext = os.path.splitext(file_path)[1].lower()
     if ext not in LINTABLE_EXTENSIONS:
         sys.exit(0)
 
+    # Get project root
+    project_root = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+
+    try:
+        relative_path = os.path.relpath(file_path, project_root)
+    except ValueError:  # Different drive on Windows
+        sys.exit(0)
+
     # Determine package
-    package = get_package_for_file(file_path)
+    package = get_package_for_file(relative_path)
     if not package:
         sys.exit(0)
 
-    # Get project root
-    project_root = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
-
     # Run lint
     lint_output = run_lint(file_path, package, project_root)
 
     if lint_output:
         # Provide feedback to Claude
-        relative_path = file_path
-        if file_path.startswith(project_root):
-            relative_path = file_path[len(project_root):].lstrip('/')
-
         output = {
             "hookSpecificOutput": {
                 "hookEventName": "PostToolUse",
@@ -12,12 +12,92 @@ Exit conditions:
 4. RALPH_FORCE_STOP=true (emergency escape hatch)
 """
 
+import contextlib
+import functools
 import json
+import mmap
 import os
 import re
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser is the fallback
+    json_loads = json.loads
+
+
+# Validation commands to look for in the transcript, per package.
+# Every pattern must start with the literal "cd <package>": the transcript
+# is searched for that literal and the patterns are only tried at its hits.
+PACKAGE_COMMANDS = {
+    "frontend": [
+        (r"cd frontend\s*&&\s*npm run build", "build"),
+        (r"cd frontend\s*&&\s*npm test", "test"),
+        (r"cd frontend\s*&&\s*npm run lint", "lint"),
+    ],
+    "backend": [
+        (r"cd backend\s*&&\s*npm run build", "build"),
+        (r"cd backend\s*&&\s*npm test", "test"),
+        (r"cd backend\s*&&\s*npm run lint", "lint"),
+    ],
+    "electron": [
+        (r"cd electron\s*&&\s*npm run build", "build"),
+        (r"cd electron\s*&&\s*npm test", "test"),
+    ],
+    "mobile": [
+        (r"cd mobile\s*&&\s*npx tsc", "build"),
+        (r"cd mobile\s*&&\s*npm test", "test"),
+    ],
+}
+
+# Failure indicators in recent output
+FAILURE_PATTERNS = [
+    r'FAIL\s+',
+    r'error TS\d+',
+    r'\d+ errors?\b',
+    r'npm ERR!',
+    r'Command failed',
+    r'Build failed',
+    r'Test failed',
+]
+
+# Success indicators in recent output
+SUCCESS_PATTERNS = [
+    r'Build completed',
+    r'All tests passed',
+    r'✓.*tests? passed',
+    r'Found \d+ warnings? and 0 errors',
+    r'0 errors',
+]
+
+
+# Failure/success indicators are only looked for near the end of the transcript
+TRANSCRIPT_TAIL_BYTES = 256 * 1024
+RECENT_LINES = 100
+
+
+# Compiled on first use: the early-exit paths in main() never need them.
+# Patterns are compiled as bytes so they can scan the mmapped transcript.
+# Only the target package's matcher is ever built in a given run.
+@functools.cache
+def _package_matcher(package: str) -> tuple[bytes, re.Pattern, list[str]]:
+    commands = PACKAGE_COMMANDS[package]
+    alternatives = '|'.join(f'(?P<c{i}>{pattern})' for i, (pattern, _) in enumerate(commands))
+    names = [name for _, name in commands]
+    return f"cd {package}".encode(), re.compile(alternatives.encode(), re.IGNORECASE), names
+
+
+@functools.cache
+def _failure_re() -> re.Pattern:
+    return re.compile('|'.join(f'(?:{p})' for p in FAILURE_PATTERNS).encode(), re.IGNORECASE)
+
+
+@functools.cache
+def _success_re() -> re.Pattern:
+    return re.compile('|'.join(f'(?:{p})' for p in SUCCESS_PATTERNS).encode(), re.IGNORECASE)
+
 
 def get_ralph_state_file() -> Path:
     """Get path to RALPH state file for tracking continuations."""
@@ -31,88 +111,102 @@ def load_ralph_state() -> dict:
     if state_file.exists():
         try:
             return json.loads(state_file.read_text())
-        except:
+        except (OSError, json.JSONDecodeError):
             pass
     return {"continuation_count": 0, "session_id": None}
 
 
 def save_ralph_state(state: dict) -> None:
-    """Save RALPH hook state."""
+    """Save RALPH hook state atomically, so a crash never leaves a torn file."""
     state_file = get_ralph_state_file()
     state_file.parent.mkdir(parents=True, exist_ok=True)
-    state_file.write_text(json.dumps(state, indent=2))
+    tmp_file = state_file.with_name(f"{state_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(state, separators=(",", ":")))
+    os.replace(tmp_file, state_file)
+
+
+@contextlib.contextmanager
+def map_transcript(transcript_path: str):
+    """Map the transcript read-only so it is scanned without copying it into memory."""
+    with open(transcript_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''  # mmap cannot map an empty file
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
 
 
-def check_validation_in_transcript(transcript: str, target_package: str) -> dict:
+def recent_transcript_output(transcript) -> bytes:
     """
-    Check if validation commands were run and passed.
-    Returns dict with 'ran' and 'passed' booleans, and 'missing' list.
+    Return the last RECENT_LINES lines of the transcript, limited to its last
+    TRANSCRIPT_TAIL_BYTES and starting on a line boundary.
     """
-    # Commands to check based on package
-    package_commands = {
-        "frontend": [
-            (r"cd frontend\s*&&\s*npm run build", "build"),
-            (r"cd frontend\s*&&\s*npm test", "test"),
-            (r"cd frontend\s*&&\s*npm run lint", "lint"),
-        ],
-        "backend": [
-            (r"cd backend\s*&&\s*npm run build", "build"),
-            (r"cd backend\s*&&\s*npm test", "test"),
-            (r"cd backend\s*&&\s*npm run lint", "lint"),
-        ],
-        "electron": [
-            (r"cd electron\s*&&\s*npm run build", "build"),
-            (r"cd electron\s*&&\s*npm test", "test"),
-        ],
-        "mobile": [
-            (r"cd mobile\s*&&\s*npx tsc", "build"),
-            (r"cd mobile\s*&&\s*npm test", "test"),
-        ],
-    }
+    floor = max(0, len(transcript) - TRANSCRIPT_TAIL_BYTES)
+    start = len(transcript)
+    found = 0
+    while found < RECENT_LINES:
+        newline = transcript.rfind(b'\n', floor, start)
+        if newline == -1:
+            break
+        start = newline
+        found += 1
+
+    if found == RECENT_LINES or (floor and found):
+        return transcript[start + 1:]
+    return transcript[floor:]
+
+
+def find_ran_commands(transcript, package: str, start: int = 0, ran: set[str] | None = None) -> set[str]:
+    """
+    Find which of the package's validation commands appear in the transcript.
+    Only bytes from start onwards are scanned; matches are added to ran.
+    """
+    anchor, command_re, names = _package_matcher(package)
+    expected = set(names)
+    ran = set() if ran is None else ran
+    pos = transcript.find(anchor, start)
+    while pos != -1 and ran != expected:
+        match = command_re.match(transcript, pos)
+        if match:
+            ran.add(names[int(match.lastgroup[1:])])
+        pos = transcript.find(anchor, pos + 1)
+    return ran
+
+
+def check_validation_in_transcript(transcript, target_package: str, scan: dict | None = None) -> dict:
+    """
+    Check if validation commands were run and passed.
+    Returns dict with 'ran' and 'passed' booleans, 'missing' list, and 'scan'.
+    The transcript may be any bytes-like object, e.g. an mmap.
 
-    commands = package_commands.get(target_package, package_commands["frontend"])
+    scan is the 'scan' entry of a previous result for the same transcript:
+    commands found before its scanned_offset are reused and only the bytes
+    appended since are searched. Failures and success are always taken from
+    the current tail.
+    """
+    package = target_package if target_package in PACKAGE_COMMANDS else "frontend"
+    start = 0
+    ran = set()
+    if scan and scan.get("package") == package and scan.get("scanned_offset", 0) <= len(transcript):
+        start = scan["scanned_offset"]
+        ran.update(scan.get("ran_commands", []))
+    find_ran_commands(transcript, package, start, ran)
 
     ran_commands = []
     missing_commands = []
 
-    for pattern, name in commands:
-        if re.search(pattern, transcript, re.IGNORECASE):
+    for _, name in PACKAGE_COMMANDS[package]:
+        if name in ran:
             ran_commands.append(name)
         else:
             missing_commands.append(name)
 
-    # Check for failures in recent output (last 100 lines)
-    recent_lines = transcript.split('\n')[-100:]
-    recent_output = '\n'.join(recent_lines)
-
-    failure_patterns = [
-        r'FAIL\s+',
-        r'error TS\d+',
-        r'\d+ errors?\b',
-        r'npm ERR!',
-        r'Command failed',
-        r'Build failed',
-        r'Test failed',
-    ]
-
-    has_failures = any(
-        re.search(p, recent_output, re.IGNORECASE)
-        for p in failure_patterns
-    )
-
-    # Check for success indicators
-    success_patterns = [
-        r'Build completed',
-        r'All tests passed',
-        r'✓.*tests? passed',
-        r'Found \d+ warnings? and 0 errors',
-        r'0 errors',
-    ]
-
-    has_success = any(
-        re.search(p, recent_output, re.IGNORECASE)
-        for p in success_patterns
-    )
+    # Check for failures, then success indicators, in recent output (last
+    # 100 lines); a failure already rules out passing, so success is skipped
+    recent_output = recent_transcript_output(transcript)
+
+    has_failures = _failure_re().search(recent_output) is not None
+    has_success = not has_failures and _success_re().search(recent_output) is not None
 
     return {
         "ran": len(ran_commands) > 0,
@@ -121,14 +215,26 @@ def check_validation_in_transcript(transcript: str, target_package: str) -> dict
         "has_failures": has_failures,
         "has_success": has_success,
         "passed": len(missing_commands) == 0 and not has_failures and has_success,
+        # Resume from the start of the last line, which may still be partial
+        "scan": {
+            "package": package,
+            "ran_commands": ran_commands,
+            "scanned_offset": transcript.rfind(b"\n") + 1,
+        },
     }
 
 
+def write_stderr(message: str) -> None:
+    """Write a line to stderr as UTF-8 bytes, bypassing the text wrapper."""
+    sys.stderr.buffer.write(f"{message}\n".encode('utf-8'))
+    sys.stderr.buffer.flush()
+
+
 def main():
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
-        print(f"Error parsing input: {e}", file=sys.stderr)
+        input_data = json_loads(sys.stdin.buffer.read())
+    except ValueError as e:
+        write_stderr(f"Error parsing input: {e}")
         sys.exit(1)
 
     # Exit condition 1: Emergency escape hatch
@@ -157,7 +263,7 @@ def main():
     # Exit condition 3: Max continuations reached
     max_continuations = int(os.environ.get("RALPH_MAX_CONTINUATIONS", "5"))
     if state["continuation_count"] > max_continuations:
-        print(f"Max continuations ({max_continuations}) reached, allowing stop", file=sys.stderr)
+        write_stderr(f"Max continuations ({max_continuations}) reached, allowing stop")
         sys.exit(0)
 
     # Read transcript
@@ -165,18 +271,21 @@ def main():
     if not transcript_path or not os.path.exists(transcript_path):
         sys.exit(0)  # Can't verify, allow stop
 
-    try:
-        with open(transcript_path, 'r') as f:
-            transcript = f.read()
-    except Exception as e:
-        print(f"Error reading transcript: {e}", file=sys.stderr)
-        sys.exit(0)
-
     # Get target package from environment (set by RALPH)
     target_package = os.environ.get("RALPH_TARGET_PACKAGE", "frontend")
 
-    # Check validation status
-    validation = check_validation_in_transcript(transcript, target_package)
+    # Check validation status, reusing the previous scan of this transcript
+    scan = state.get("transcript_scan")
+    if not scan or scan.get("transcript_path") != transcript_path:
+        scan = None
+    try:
+        with map_transcript(transcript_path) as transcript:
+            validation = check_validation_in_transcript(transcript, target_package, scan)
+    except (OSError, ValueError) as e:
+        write_stderr(f"Error reading transcript: {e}")
+        sys.exit(0)
+
+    state["transcript_scan"] = {"transcript_path": transcript_path, **validation["scan"]}
 
     # Exit condition 4: Validation passed
     if validation["passed"]:
@@ -184,6 +293,8 @@ def main():
         save_ralph_state(state)
         sys.exit(0)
 
+    save_ralph_state(state)
+
     # Block and provide guidance
     if validation["missing"]:
         reason = f"Run validation before completing. Missing: {', '.join(validation['missing'])}. "